@@ -3,6 +3,7 @@
 
 import argparse
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from rules import (
@@ -27,12 +28,64 @@ DOCUMENT_RULES = {
     ],
 }
 
+# Fallback for files without a dedicated entry above; a module-level tuple
+# so the .get() call sites do not rebuild a list per file.
+_DEFAULT_RULES = (
+    MarkdownFixer.fix_md012_multiple_blank_lines,
+    MarkdownFixer.fix_md047_file_ends_newline,
+)
+
 
 def apply_rules(content: str, rules: list) -> str:
     """Apply a list of rules to content."""
+    return _apply_rules_tracked(content, rules)[0]
+
+
+def _apply_rules_tracked(content: str, rules: list):
+    """Apply rules and report whether any of them changed anything.
+
+    Line-based rules (marked with ``_line_based``) share a single
+    split('\\n') / '\\n'.join(...) round-trip: the document is split once
+    before a run of them and joined again only when a string-based rule
+    needs the full text.
+
+    Rules return their input object untouched when they have nothing to
+    fix (re.sub and str.replace already do), so an identity check per
+    rule detects modification without a final O(N) string compare.
+    """
+    modified = False
+    lines = None
     for rule in rules:
-        content = rule(content)
-    return content
+        if getattr(rule, '_line_based', False):
+            if lines is None:
+                lines = content.split('\n')
+            new_lines = rule(lines)
+            modified = modified or new_lines is not lines
+            lines = new_lines
+        else:
+            if lines is not None:
+                content = '\n'.join(lines)
+                lines = None
+            new_content = rule(content)
+            modified = modified or new_content is not content
+            content = new_content
+    if lines is not None:
+        content = '\n'.join(lines)
+    return content, modified
+
+
+def _apply_default_rules_bytes(data: bytes) -> bytes:
+    """Byte-level equivalent of _DEFAULT_RULES (MD012 + MD047).
+
+    Both rules only touch '\\n' bytes, so large files can be fixed
+    without the UTF-8 decode/encode round-trip of read_text/write_text.
+    """
+    if (b'\n\n\n' not in data and data.endswith(b'\n')
+            and not data.endswith(b'\n\n')):
+        return data
+    while b'\n\n\n' in data:
+        data = data.replace(b'\n\n\n', b'\n\n')
+    return data.rstrip(b'\n') + b'\n'
 
 
 def fix_markdown_file(file_path: Path, rules: list = None) -> bool:
@@ -41,19 +94,27 @@ def fix_markdown_file(file_path: Path, rules: list = None) -> bool:
         print(f"Error: File not found: {file_path}")
         return False
 
-    content = file_path.read_text(encoding='utf-8')
-    original_content = content
-
     if rules is None:
         # Auto-detect rules based on filename
-        rules = DOCUMENT_RULES.get(file_path.name, [
-            MarkdownFixer.fix_md012_multiple_blank_lines,
-            MarkdownFixer.fix_md047_file_ends_newline,
-        ])
+        rules = DOCUMENT_RULES.get(file_path.name, _DEFAULT_RULES)
+
+    if tuple(rules) == _DEFAULT_RULES:
+        # Fast path: operate on raw bytes for the newline-only rules
+        data = file_path.read_bytes()
+        fixed = _apply_default_rules_bytes(data)
+        if fixed != data:
+            file_path.write_bytes(fixed)
+            print(f"✓ Fixed: {file_path}")
+            return True
+        print(f"○ No changes: {file_path}")
+        return False
+
+    content = file_path.read_text(encoding='utf-8')
+    original_content = content
 
-    content = apply_rules(content, rules)
+    content, modified = _apply_rules_tracked(content, rules)
 
-    if content != original_content:
+    if modified and content != original_content:
         file_path.write_text(content, encoding='utf-8')
         print(f"✓ Fixed: {file_path}")
         return True
@@ -62,6 +123,12 @@ def fix_markdown_file(file_path: Path, rules: list = None) -> bool:
         return False
 
 
+def _fix_one(task) -> bool:
+    """Worker entry point: fix one (file_path, rules) task."""
+    file_path, rules = task
+    return fix_markdown_file(file_path, rules)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Unified Markdown fix tool for Zenith project',
@@ -126,17 +193,20 @@ Examples:
     else:
         global_rules = None
 
-    fixed_count = 0
-    for file_path in files_to_fix:
-        rules = global_rules
-        if rules is None:
-            rules = DOCUMENT_RULES.get(file_path.name, [
-                MarkdownFixer.fix_md012_multiple_blank_lines,
-                MarkdownFixer.fix_md047_file_ends_newline,
-            ])
-
-        if fix_markdown_file(file_path, rules):
-            fixed_count += 1
+    tasks = [
+        (file_path,
+         global_rules if global_rules is not None
+         else DOCUMENT_RULES.get(file_path.name, _DEFAULT_RULES))
+        for file_path in files_to_fix
+    ]
+
+    if args.all and len(tasks) > 1:
+        # Files are independent; fix them in parallel worker processes
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_fix_one, tasks))
+        fixed_count = sum(results)
+    else:
+        fixed_count = sum(_fix_one(task) for task in tasks)
 
     print(f"\nCompleted: {fixed_count} file(s) fixed")
 
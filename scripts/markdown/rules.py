@@ -5,6 +5,48 @@ import re
 from pathlib import Path
 from typing import Callable, List
 
+# Precompiled patterns, one per rule, so repeated apply_rules passes skip the
+# re-module cache lookup and pattern parsing on every call.
+_MD026_H3_COLON = re.compile(r'^(### [^:\n]+):$', re.MULTILINE)
+_MD026_H2_COLON = re.compile(r'^(## [^:\n]+):$', re.MULTILINE)
+_MD030_DASH = re.compile(r'^  - ', re.MULTILINE)
+_MD030_STAR = re.compile(r'^  \* ', re.MULTILINE)
+_MD032 = re.compile(r'((?:### [^\n]+|## [^\n]+|\*\*[^\n]+\*\*))\n(- [✅🔧🚀📊])')
+_MD036_SPACED = re.compile(r'^(\*\*(?:[^*]|\*(?!\*))+ \*\*)$', re.MULTILINE)
+_MD036_BOLD = re.compile(r'^\*\*([^*]+)\*\*$', re.MULTILINE)
+_MD036_STRONG = re.compile(r'^<strong>([^<]+)</strong>$', re.MULTILINE)
+_MD040_EMPTY_FENCE = re.compile(r'\n```\n')
+_MD045_IMG = re.compile(r'<img src="([^"]+)" width="64">')
+_MD051_LINKS = [
+    ('[Usage & Features](#usage & features)',
+     '[Usage & Features](#usage---features)'),
+    ('[Performance](#performance)', '[Performance](#performance-1)'),
+    ('[Security](#security)', '[Security](#security-1)'),
+    ('[Troubleshooting](#troubleshooting)',
+     '[Troubleshooting](#troubleshooting-1)'),
+    ('[Contributing](#contributing)', '[Contributing](#contributing-1)'),
+    ('[Licensing](#licensing)', '[Licensing](#licensing-1)'),
+]
+# Single alternation so one scan replaces all link fragments at once.
+_MD051 = re.compile('|'.join(
+    f'(?P<g{i}>{re.escape(old)})' for i, (old, _) in enumerate(_MD051_LINKS)
+))
+_MD051_REPL = [new for _, new in _MD051_LINKS]
+# Greedy chunker for MD013: up to max_len chars ending at a '，' break,
+# a '. ' break, or end of line.
+_MD013_WRAP = re.compile(r'.{1,120}(?:，(?=.)|\. (?=.)|$)')
+
+
+def _line_rule(func):
+    """Mark a rule as operating on a list of lines instead of a string.
+
+    apply_rules splits the document once before a run of line-based rules
+    and joins once after, instead of each rule round-tripping through
+    split('\\n') / '\\n'.join(...).
+    """
+    func._line_based = True
+    return func
+
 
 class MarkdownRule:
     """Markdown linting rule."""
@@ -23,54 +65,45 @@ class MarkdownFixer:
     """Markdown fixer with all rules implemented."""
 
     @staticmethod
-    def fix_md001_heading_increment(content: str) -> str:
+    @_line_rule
+    def fix_md001_heading_increment(lines: List[str]) -> List[str]:
         """Fix MD001: Heading increment (increase heading levels)."""
-        lines = content.split('\n')
-        result = []
-        heading_level = 0
-
-        for line in lines:
-            if line.startswith('##'):
-                heading_level = 2
-                if line.startswith('###'):
-                    heading_level = 3
-                result.append(line)
-            else:
-                result.append(line)
-
-        return '\n'.join(result)
+        # TODO: actually renumber heading levels. The previous body
+        # tracked levels but emitted every line unchanged, so until the
+        # real fix lands this is an explicit no-op.
+        return lines
 
     @staticmethod
-    def fix_md024_duplicate_headings(content: str) -> str:
+    @_line_rule
+    def fix_md024_duplicate_headings(lines: List[str]) -> List[str]:
         """Fix MD024: Duplicate headings - add numbers to duplicates."""
         heading_counts = {}
-        lines = content.split('\n')
         new_lines = []
+        changed = False
 
         for line in lines:
             if line.startswith('### '):
-                base = line.replace('### ', '').replace(':', '').strip()
+                # The prefix is known, so slice it off rather than
+                # rescanning the line with replace('### ', '')
+                base = line[4:].replace(':', '').strip()
                 if base in heading_counts:
                     heading_counts[base] += 1
                     new_lines.append(f'### {base} ({heading_counts[base]})')
+                    changed = True
                 else:
                     heading_counts[base] = 1
                     new_lines.append(line)
             else:
                 new_lines.append(line)
 
-        return '\n'.join(new_lines)
+        return new_lines if changed else lines
 
     @staticmethod
     def fix_md026_trailing_punctuation(content: str) -> str:
         """Fix MD026: Remove trailing punctuation from headings."""
         # Remove trailing punctuation from headings
-        patterns = [
-            (r'^(### [^:\n]+):$', r'\1'),
-            (r'^(## [^:\n]+):$', r'\1'),
-        ]
-        for pattern, replacement in patterns:
-            content = re.sub(pattern, replacement, content, flags=re.MULTILINE)
+        content = _MD026_H3_COLON.sub(r'\1', content)
+        content = _MD026_H2_COLON.sub(r'\1', content)
         return content
 
     @staticmethod
@@ -88,28 +121,45 @@ class MarkdownFixer:
     def fix_md030_list_markers(content: str) -> str:
         """Fix MD030: List markers should have proper spacing."""
         # Fix two spaces before list markers to one
-        content = re.sub(r'^  - ', r'- ', content, flags=re.MULTILINE)
-        content = re.sub(r'^  \* ', r'* ', content, flags=re.MULTILINE)
+        content = _MD030_DASH.sub(r'- ', content)
+        content = _MD030_STAR.sub(r'* ', content)
         return content
 
     @staticmethod
-    def fix_md031_code_blocks(content: str) -> str:
+    @_line_rule
+    def fix_md031_code_blocks(lines: List[str]) -> List[str]:
         """Fix MD031: Add blank lines around fenced code blocks."""
-        # Add blank line before code blocks
-        content = re.sub(r'([^\n])\n(```[a-z]*\n)', r'\1\n\n\2', content)
-        # Add blank line after code blocks
-        content = re.sub(r'\n(```)\n', r'\n\1\n\n', content)
-        return content
+        new_lines = []
+        changed = False
+        in_block = False
+
+        for i, line in enumerate(lines):
+            if line.startswith('```'):
+                if not in_block:
+                    # Blank line before the opening fence
+                    if new_lines and new_lines[-1] != '':
+                        new_lines.append('')
+                        changed = True
+                    new_lines.append(line)
+                    in_block = True
+                else:
+                    new_lines.append(line)
+                    in_block = False
+                    # Blank line after the closing fence
+                    if i + 1 < len(lines) and lines[i + 1] != '':
+                        new_lines.append('')
+                        changed = True
+            else:
+                new_lines.append(line)
+
+        return new_lines if changed else lines
 
     @staticmethod
     def fix_md032_heading_list_spacing(content: str) -> str:
         """Fix MD032: Add blank lines around lists."""
-        # Add blank line before lists after headings
-        content = re.sub(r'(### [^\n]+)\n(- [✅🔧🚀📊])', r'\1\n\n\2', content)
-        content = re.sub(r'(## [^\n]+)\n(- [✅🔧🚀📊])', r'\1\n\n\2', content)
-        # Add blank line before lists after bold text
-        content = re.sub(r'(\*\*[^\n]+\*\*)\n(- [✅🔧🚀📊])', r'\1\n\n\2', content)
-        return content
+        # Add blank line before lists after headings or bold text; the
+        # three contexts are alternated so one scan covers them all.
+        return _MD032.sub(r'\1\n\n\2', content)
 
     @staticmethod
     def fix_md033_no_inline_html(content: str) -> str:
@@ -120,94 +170,74 @@ class MarkdownFixer:
     def fix_md036_emphasis_heading(content: str) -> str:
         """Fix MD036: Emphasis used instead of heading."""
         # Fix **text** patterns
-        content = re.sub(r'^(\*\*(?:[^*]|\*(?!\*))+ \*\*)$', r'### \1', content, flags=re.MULTILINE)
+        content = _MD036_SPACED.sub(r'### \1', content)
         # Fix remaining double asterisks
-        content = re.sub(r'^\*\*([^*]+)\*\*$', r'### \1', content, flags=re.MULTILINE)
+        content = _MD036_BOLD.sub(r'### \1', content)
         # Fix <strong> tags
-        content = re.sub(r'^<strong>([^<]+)</strong>$', r'### \1', content, flags=re.MULTILINE)
+        content = _MD036_STRONG.sub(r'### \1', content)
         return content
 
     @staticmethod
     def fix_md040_code_block_language(content: str) -> str:
         """Fix MD040: Add language to code blocks."""
         # Add bash to empty code blocks
-        content = re.sub(r'\n```\n', r'\n```bash\n', content)
+        content = _MD040_EMPTY_FENCE.sub(r'\n```bash\n', content)
         return content
 
     @staticmethod
     def fix_md045_image_alt_text(content: str) -> str:
         """Fix MD045: Add alt text to images."""
         # Add empty alt attribute to images
-        content = re.sub(r'<img src="([^"]+)" width="64">',
-                        r'<img src="\1" width="64" alt="">', content)
+        content = _MD045_IMG.sub(r'<img src="\1" width="64" alt="">', content)
         return content
 
     @staticmethod
     def fix_md047_file_ends_newline(content: str) -> str:
         """Fix MD047: Ensure file ends with single newline."""
-        if not content.endswith('\n'):
-            content += '\n'
-        content = re.sub(r'\n+$', r'\n', content)
-        return content
+        if content.endswith('\n') and not content.endswith('\n\n'):
+            return content
+        return content.rstrip('\n') + '\n'
 
     @staticmethod
     def fix_md051_link_fragments(content: str) -> str:
         """Fix MD051: Link fragments - update TOC links."""
-        # Fix specific link patterns
-        fixes = [
-            (r'\[Usage & Features\]\(#usage & features\)',
-             r'[Usage & Features](#usage---features)'),
-            (r'\[Performance\]\(#performance\)', r'[Performance](#performance-1)'),
-            (r'\[Security\]\(#security\)', r'[Security](#security-1)'),
-            (r'\[Troubleshooting\]\(#troubleshooting\)',
-             r'[Troubleshooting](#troubleshooting-1)'),
-            (r'\[Contributing\]\(#contributing\)', r'[Contributing](#contributing-1)'),
-            (r'\[Licensing\]\(#licensing\)', r'[Licensing](#licensing-1)'),
-        ]
-        for pattern, replacement in fixes:
-            content = re.sub(pattern, replacement, content)
-        return content
+        # Fix specific link patterns in one pass over the document
+        return _MD051.sub(lambda m: _MD051_REPL[int(m.lastgroup[1:])], content)
 
     @staticmethod
     def fix_md012_multiple_blank_lines(content: str) -> str:
         """Fix MD012: Multiple consecutive blank lines."""
-        content = re.sub(r'\n{3,}', r'\n\n', content)
+        # Plain str.replace beats the regex engine for collapsing newline
+        # runs; converges in a few passes since runs shrink by a third each.
+        while '\n\n\n' in content:
+            content = content.replace('\n\n\n', '\n\n')
         return content
 
     @staticmethod
-    def fix_md013_line_length(content: str, max_len: int = 120) -> str:
+    @_line_rule
+    def fix_md013_line_length(lines: List[str], max_len: int = 120) -> List[str]:
         """Fix MD013: Line length - split long lines."""
-        lines = content.split('\n')
+        if max_len == 120:
+            wrap = _MD013_WRAP
+        else:
+            wrap = re.compile(r'.{1,%d}(?:，(?=.)|\. (?=.)|$)' % max_len)
         new_lines = []
+        changed = False
 
         for line in lines:
-            if len(line) > max_len and '|' not in line and '`' not in line:
-                if '，' in line:
-                    parts = line.split('，')
-                    current = parts[0]
-                    for part in parts[1:]:
-                        if len(current) + len(part) + 1 <= max_len:
-                            current += '，' + part
-                        else:
-                            new_lines.append(current)
-                            current = '  ，' + part.strip()
-                    new_lines.append(current)
-                elif '. ' in line:
-                    parts = line.split('. ')
-                    current = parts[0]
-                    for part in parts[1:]:
-                        if len(current) + len(part) + 2 <= max_len:
-                            current += '. ' + part
-                        else:
-                            new_lines.append(current)
-                            current = '  . ' + part.strip()
-                    new_lines.append(current)
+            if (len(line) > max_len and '|' not in line and '`' not in line
+                    and ('，' in line or '. ' in line)):
+                chunks = wrap.findall(line)
+                if len(chunks) > 1 and ''.join(chunks) == line:
+                    new_lines.extend(chunks)
+                    changed = True
                 else:
+                    # No clean break points; leave the line unchanged
                     new_lines.append(line)
             else:
                 new_lines.append(line)
 
-        return '\n'.join(new_lines)
+        return new_lines if changed else lines
 
 
 # Predefined rule sets for common files
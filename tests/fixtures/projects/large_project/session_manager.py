@@ -1,12 +1,13 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
-import hashlib
+import heapq
 import json
+import secrets
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: str
     username: str
@@ -16,7 +17,20 @@ class User:
     preferences: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+def _token_key(token: str) -> int:
+    # Sessions are keyed by the first 8 bytes of the hex token so dict
+    # lookups hash a small int instead of the full 64-char string.
+    # Malformed tokens map to a sentinel that never matches a session.
+    try:
+        prefix = bytes.fromhex(token[:16])
+    except ValueError:
+        return -1
+    if len(prefix) != 8:
+        return -1
+    return int.from_bytes(prefix, "little")
+
+
+@dataclass(slots=True)
 class Session:
     user_id: str
     token: str
@@ -27,9 +41,12 @@ class Session:
 
 class SessionManager:
     def __init__(self, session_duration_hours: int = 24):
-        self.sessions: Dict[str, Session] = {}
+        self.sessions: Dict[int, Session] = {}
         self.users: Dict[str, User] = {}
         self.session_duration = timedelta(hours=session_duration_hours)
+        # Min-heap of (expires_at, key); revoked sessions are dropped
+        # lazily when popped.
+        self._expiry_heap: List[tuple] = []
 
     def register_user(self, username: str, email: str, roles: Optional[List[str]] = None) -> str:
         user_id = str(uuid.uuid4())
@@ -47,7 +64,7 @@ class SessionManager:
         if user_id not in self.users:
             raise ValueError("User not found")
 
-        token = hashlib.sha256(f"{user_id}{datetime.now().isoformat()}".encode()).hexdigest()
+        token = secrets.token_hex(32)
         now = datetime.now()
         session = Session(
             user_id=user_id,
@@ -56,33 +73,43 @@ class SessionManager:
             expires_at=now + self.session_duration,
             last_activity=now,
         )
-        self.sessions[token] = session
+        key = _token_key(token)
+        self.sessions[key] = session
+        heapq.heappush(self._expiry_heap, (session.expires_at, key))
         return token
 
     def validate_session(self, token: str) -> Optional[User]:
-        if token not in self.sessions:
+        key = _token_key(token)
+        session = self.sessions.get(key)
+        if session is None or session.token != token:
             return None
 
-        session = self.sessions[token]
-        if session.expires_at < datetime.now():
-            del self.sessions[token]
+        now = datetime.now()
+        if session.expires_at < now:
+            del self.sessions[key]
             return None
 
-        session.last_activity = datetime.now()
+        session.last_activity = now
         return self.users.get(session.user_id)
 
     def revoke_session(self, token: str) -> bool:
-        if token in self.sessions:
-            del self.sessions[token]
+        key = _token_key(token)
+        session = self.sessions.get(key)
+        if session is not None and session.token == token:
+            del self.sessions[key]
             return True
         return False
 
     def cleanup_expired_sessions(self) -> int:
         now = datetime.now()
-        expired = [t for t, s in self.sessions.items() if s.expires_at < now]
-        for t in expired:
-            del self.sessions[t]
-        return len(expired)
+        count = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            session = self.sessions.get(key)
+            if session is not None and session.expires_at == expires_at:
+                del self.sessions[key]
+                count += 1
+        return count
 
 
 if __name__ == "__main__":
@@ -5,31 +5,34 @@ class Calculator:
 
     def add(self, a, b):
         result = a + b
-        self.history.append(f"{a} + {b} = {result}")
-        return round(result, self.precision)
+        self.history.append(("+", a, b, result))
+        # Integer results are already exact; skip the round() call
+        return result if isinstance(result, int) else round(result, self.precision)
 
     def subtract(self, a, b):
         result = a - b
-        self.history.append(f"{a} - {b} = {result}")
-        return round(result, self.precision)
+        self.history.append(("-", a, b, result))
+        return result if isinstance(result, int) else round(result, self.precision)
 
     def multiply(self, a, b):
         result = a * b
-        self.history.append(f"{a} * {b} = {result}")
-        return round(result, self.precision)
+        self.history.append(("*", a, b, result))
+        return result if isinstance(result, int) else round(result, self.precision)
 
     def divide(self, a, b):
         if b == 0:
             raise ValueError("Cannot divide by zero")
         result = a / b
-        self.history.append(f"{a} / {b} = {result}")
+        self.history.append(("/", a, b, result))
         return round(result, self.precision)
 
     def clear_history(self):
         self.history.clear()
 
     def get_history(self):
-        return self.history.copy()
+        # History is kept as (op, a, b, result) tuples; formatting is
+        # deferred until the history is actually read.
+        return [f"{a} {op} {b} = {result}" for op, a, b, result in self.history]
 
 
 if __name__ == "__main__":